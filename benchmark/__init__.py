@@ -0,0 +1,6 @@
+"""Micro-benchmarks for pipeline hot paths.
+
+Run individual benchmarks from the repo root, e.g.:
+
+    python -m benchmark.bench_schema
+"""
@@ -0,0 +1,125 @@
+"""Benchmark RobotCommand construction against a slotted-dataclass prototype.
+
+Context: we evaluated rewriting RobotCommand as an attrs/slotted dataclass
+to shave per-command construction cost. The numbers here show pydantic v2's
+Rust-core validation is within a small constant factor of a hand-validated
+dataclass on this schema (single-digit microseconds per command), while the
+pydantic API surface (model_json_schema for the strict LLM response format,
+model_copy for cached/templated commands, model_dump round-trips) is
+load-bearing across the pipeline. Decision: stay on pydantic; trusted-path
+construction bypasses the validator chain instead (see
+RobotCommand.construct paths in schema/command_schema.py).
+
+Usage (from the repo root, so the top-level packages resolve):
+    python -m benchmark.bench_schema
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import orjson
+
+from schema.command_schema import Action, MAGNITUDE_MM, Magnitude, RobotCommand
+
+N = 50_000
+
+
+@dataclass(slots=True)
+class _DataclassCommand:
+    """Slotted-dataclass prototype with hand-rolled validation."""
+
+    action: Action
+    magnitude: Optional[Magnitude]
+    confidence: float
+    raw_text: str
+    frame: str = "CAMERA"
+    value_mm: Optional[float] = None
+
+    def __post_init__(self):
+        if not 0.0 <= self.confidence <= 1.0:
+            raise ValueError(f"confidence out of range: {self.confidence}")
+        if self.action == Action.STOP:
+            self.magnitude = None
+            self.value_mm = None
+        elif self.magnitude is not None and self.value_mm is None:
+            self.value_mm = MAGNITUDE_MM[self.magnitude]
+
+
+def _bench(label: str, fn) -> float:
+    start = time.perf_counter()
+    for _ in range(N):
+        fn()
+    elapsed = time.perf_counter() - start
+    per_call_us = elapsed / N * 1e6
+    print(f"  {label:<28} {per_call_us:8.2f} µs/command")
+    return per_call_us
+
+
+def main():
+    print(f"RobotCommand construction, {N} iterations each:\n")
+    _bench(
+        "pydantic (validated)",
+        lambda: RobotCommand(
+            action="MOVE_UP", magnitude="SMALL", confidence=0.9, raw_text="up"
+        ),
+    )
+    _bench(
+        "dataclass prototype",
+        lambda: _DataclassCommand(
+            action=Action.MOVE_UP,
+            magnitude=Magnitude.SMALL,
+            confidence=0.9,
+            raw_text="up",
+        ),
+    )
+    # AOT-compilation check (mypyc/Cython of the validator): validated
+    # construction runs almost entirely inside pydantic-core, which is
+    # already compiled Rust — including the model_validator dispatch.
+    # The only interpreter-resident candidate is construct_trusted, whose
+    # Python-level branching plus model_construct measures *slower* than
+    # the Rust path on this schema (model_construct is pure Python in
+    # pydantic v2); its value is skipping validation semantics, not time.
+    # Neither mypyc nor Cython can compile a module whose classes come
+    # from pydantic's metaclass without forking the model definitions.
+    # Decision: no AOT build step; there is no interpreted validator
+    # left to compile.
+    _bench(
+        "pydantic (trusted path)",
+        lambda: RobotCommand.construct_trusted(
+            action=Action.MOVE_UP,
+            magnitude=Magnitude.SMALL,
+            confidence=0.9,
+            raw_text="up",
+        ),
+    )
+
+    # LLM response path: orjson.loads feeding construction. We adopted
+    # orjson (C-level, ~4x stdlib json) but rejected routing the decoded
+    # dict through construct_trusted with Python-level enum coercion —
+    # RobotCommand(**data) does the same coercion inside pydantic-core
+    # and measures ~2x faster, consistent with the AOT note above.
+    payload = orjson.dumps(
+        {"action": "MOVE_UP", "magnitude": "SMALL",
+         "confidence": 0.9, "frame": "CAMERA", "raw_text": "up"}
+    )
+    print(f"\nLLM response decode + construction, {N} iterations each:\n")
+    _bench(
+        "orjson + RobotCommand(**d)",
+        lambda: RobotCommand(**orjson.loads(payload)),
+    )
+
+    def _fused_trusted():
+        d = orjson.loads(payload)
+        RobotCommand.construct_trusted(
+            action=Action(d["action"]),
+            magnitude=Magnitude(d["magnitude"]) if d.get("magnitude") else None,
+            confidence=float(d["confidence"]),
+            raw_text=d["raw_text"],
+        )
+
+    _bench("orjson + construct_trusted", _fused_trusted)
+
+
+if __name__ == "__main__":
+    main()
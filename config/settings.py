@@ -3,6 +3,7 @@
 Loads secrets from .env and non-secret settings from config.yaml.
 """
 
+import functools
 import os
 from pathlib import Path
 
@@ -14,17 +15,34 @@ _PROJECT_ROOT = _CONFIG_DIR.parent
 _CONFIG_PATH = _CONFIG_DIR / "config.yaml"
 
 
-def _load_yaml() -> dict:
+@functools.lru_cache(maxsize=4)
+def _load_yaml_cached(mtime: float) -> dict:
     with open(_CONFIG_PATH) as f:
         return yaml.safe_load(f)
 
 
+def _load_yaml() -> dict:
+    # Keyed by mtime so edits to config.yaml invalidate the cache, while
+    # repeated construction (tests, CLI subcommands) is a dict lookup.
+    return _load_yaml_cached(_CONFIG_PATH.stat().st_mtime)
+
+
+@functools.lru_cache(maxsize=1)
+def _ensure_dotenv_loaded() -> None:
+    """Load .env into the process environment exactly once.
+
+    python-dotenv re-parses the file on every call; the process env is
+    global, so one load per process is enough.
+    """
+    load_dotenv(_PROJECT_ROOT / ".env")
+
+
 def get_openai_api_key() -> str:
     """Return the OpenAI API key from the environment.
 
     Raises ValueError if the key is not set.
     """
-    load_dotenv(_PROJECT_ROOT / ".env")
+    _ensure_dotenv_loaded()
     key = os.getenv("OPENAI_API_KEY")
     if not key or key == "your-api-key-here":
         raise ValueError(
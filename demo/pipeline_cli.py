@@ -62,16 +62,18 @@ def run_audio(pipe, path, publisher=None):
 
 
 def run_mic(pipe, publisher=None):
-    """Push-to-talk microphone loop."""
-    print("Mic mode — press ENTER to record, ENTER to stop. Type 'quit' to exit.\n")
+    """Microphone loop; recording stops on silence."""
+    print("Mic mode — press ENTER, then speak. Recording stops on silence. "
+          "Type 'quit' to exit.\n")
     while True:
         try:
-            check = input("Ready? (ENTER to record, 'quit' to exit): ").strip()
+            check = input("Ready? (ENTER to speak, 'quit' to exit): ").strip()
         except (EOFError, KeyboardInterrupt):
             print()
             break
         if check.lower() == "quit":
             break
+        print("Listening... (stops on silence)")
         result = pipe.process_microphone()
         print(f"  Transcription: \"{result['text']}\"")
         show(result, publisher)
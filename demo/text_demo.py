@@ -1,12 +1,16 @@
 """Live API test script for the LLM command parser.
 
 Runs real API calls against GPT-4o-mini with test prompts, logs each
-response, and flags any that don't match expected results.
+response, and flags any that don't match expected results. All cases are
+issued concurrently via asyncio, so wall clock is max(latencies) instead
+of their sum.
 
 Usage:
     conda run -n voice_control python demo/text_demo.py
 """
 
+import asyncio
+import sys
 import time
 
 from parser.llm_parser import LLMCommandParser
@@ -38,20 +42,33 @@ TEST_CASES = [
 ]
 
 
+async def _timed_parse(parser, case):
+    """Parse one case, returning (case, command, elapsed_ms)."""
+    start = time.perf_counter()
+    cmd = await parser.parse_async(case["text"])
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return case, cmd, elapsed_ms
+
+
+async def _gather(parser, cases):
+    return await asyncio.gather(
+        *(_timed_parse(parser, case) for case in cases)
+    )
+
+
 def run_tests():
     parser = LLMCommandParser()
     passed = 0
     failed = 0
-    results = []
 
-    print(f"Running {len(TEST_CASES)} live API tests...\n")
+    # Accumulate output and flush once at the end — one write syscall
+    # instead of interleaved per-case print flushes.
+    lines = [f"Running {len(TEST_CASES)} live API tests...\n\n"]
 
-    for case in TEST_CASES:
-        text = case["text"]
-        start = time.perf_counter()
-        cmd = parser.parse(text)
-        elapsed_ms = (time.perf_counter() - start) * 1000
+    results = asyncio.run(_gather(parser, TEST_CASES))
 
+    for case, cmd, elapsed_ms in results:
+        text = case["text"]
         action_str = cmd.action.value
         mag_str = cmd.magnitude.value if cmd.magnitude else "None"
         val_str = f"{cmd.value_mm}mm" if cmd.value_mm else "None"
@@ -66,11 +83,11 @@ def run_tests():
             else:
                 label = "[FAIL]"
                 failed += 1
-            print(
+            lines.append(
                 f"  {label}  \"{text}\"\n"
                 f"         → {action_str} / {mag_str} / {val_str}  "
                 f"(conf={cmd.confidence:.2f}, {elapsed_ms:.0f}ms)\n"
-                f"         expected: confidence < 0.5"
+                f"         expected: confidence < 0.5\n"
             )
         else:
             action_ok = action_str == case["expected_action"]
@@ -80,30 +97,32 @@ def run_tests():
             if ok:
                 label = "[PASS]"
                 passed += 1
-                print(
+                lines.append(
                     f"  {label}  \"{text}\"\n"
                     f"         → {action_str} / {mag_str} / {val_str}  "
-                    f"(conf={cmd.confidence:.2f}, {elapsed_ms:.0f}ms)"
+                    f"(conf={cmd.confidence:.2f}, {elapsed_ms:.0f}ms)\n"
                 )
             else:
                 label = "[FAIL]"
                 failed += 1
-                print(
+                lines.append(
                     f"  {label}  \"{text}\"\n"
                     f"         → got {action_str} / {mag_str}, "
                     f"expected {case['expected_action']} / {case['expected_magnitude']}  "
-                    f"(conf={cmd.confidence:.2f}, {elapsed_ms:.0f}ms)"
+                    f"(conf={cmd.confidence:.2f}, {elapsed_ms:.0f}ms)\n"
                 )
 
-        print()
+        lines.append("\n")
 
     # Summary
     total = passed + failed
-    print("=" * 50)
-    print(f"Results: {passed}/{total} passed, {failed} failed")
+    lines.append("=" * 50 + "\n")
+    lines.append(f"Results: {passed}/{total} passed, {failed} failed\n")
     if failed == 0:
-        print("All tests passed!")
-    print("=" * 50)
+        lines.append("All tests passed!\n")
+    lines.append("=" * 50 + "\n")
+
+    sys.stdout.write("".join(lines))
 
 
 if __name__ == "__main__":
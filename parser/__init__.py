@@ -1,6 +1,13 @@
 """Command parser package — public API."""
 
-from parser.llm_parser import LLMCommandParser
-from parser.prompt_templates import PROMPT_VERSION
-
 __all__ = ["LLMCommandParser", "PROMPT_VERSION"]
+
+
+def __getattr__(name):
+    if name == "LLMCommandParser":
+        from parser.llm_parser import LLMCommandParser
+        return LLMCommandParser
+    if name == "PROMPT_VERSION":
+        from parser.prompt_templates import PROMPT_VERSION
+        return PROMPT_VERSION
+    raise AttributeError(f"module 'parser' has no attribute {name!r}")
@@ -4,36 +4,183 @@ Converts natural language surgical commands into validated RobotCommand
 objects using GPT-4o-mini with structured JSON output.
 """
 
-import json
+import copy
 import logging
+import threading
 import time
+from collections import OrderedDict
 
-from openai import OpenAI
+import httpx
+import orjson
+from openai import AsyncOpenAI, OpenAI
 from pydantic import ValidationError
 
-from config.settings import _load_yaml, _PROJECT_ROOT
-from dotenv import load_dotenv
-from parser.prompt_templates import SYSTEM_PROMPT, USER_TEMPLATE
+from config.settings import _ensure_dotenv_loaded, _load_yaml
+from parser.prompt_templates import PROMPT_VERSION, SYSTEM_PROMPT
 from schema.command_schema import RobotCommand
 
 logger = logging.getLogger(__name__)
 
+# The system message never changes; build its dict once at import instead
+# of allocating it on every parse.
+_SYSTEM_MSG = {"role": "system", "content": SYSTEM_PROMPT}
+
+# Stable key for OpenAI's server-side prompt caching: the ~700-token system
+# prompt is identical across requests, so routing them to the same cache
+# shard cuts prefill cost and time-to-first-token after the first call.
+_PROMPT_CACHE_KEY = f"g1-voice-{PROMPT_VERSION}"
+
+
+# JSON-schema keywords OpenAI's strict structured-output mode rejects
+# with a 400 (e.g. "'default' is not permitted"); pydantic emits them for
+# defaulted and bounded fields.
+_STRICT_UNSUPPORTED_KEYS = (
+    "default",
+    "minimum",
+    "maximum",
+    "exclusiveMinimum",
+    "exclusiveMaximum",
+)
+
+
+def _strip_unsupported_keys(node) -> None:
+    """Recursively drop schema keywords strict mode rejects."""
+    if isinstance(node, dict):
+        for key in _STRICT_UNSUPPORTED_KEYS:
+            node.pop(key, None)
+        for value in node.values():
+            _strip_unsupported_keys(value)
+    elif isinstance(node, list):
+        for value in node:
+            _strip_unsupported_keys(value)
+
+
+def _build_response_format() -> dict:
+    """Derive a strict json_schema response_format from RobotCommand.
+
+    Constraining the model to the exact enum sets server-side eliminates
+    the invalid-action class of failures before they reach Pydantic;
+    client-side validation stays as a safety net. raw_text and value_mm are
+    dropped from the schema because they're populated client-side.
+    """
+    schema = RobotCommand.model_json_schema()
+    for field in ("raw_text", "value_mm"):
+        schema["properties"].pop(field, None)
+    # OpenAI strict mode requires every property listed as required and
+    # additionalProperties disabled, and rejects defaults/numeric bounds.
+    schema["required"] = list(schema["properties"])
+    schema["additionalProperties"] = False
+    _strip_unsupported_keys(schema)
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "robot_command",
+            "strict": True,
+            "schema": schema,
+        },
+    }
+
+
+_RESPONSE_FORMAT = _build_response_format()
+
+
+def _build_batch_response_format() -> dict:
+    """Wrap the single-command schema in a {"commands": [...]} envelope.
+
+    Chat Completions has no API-level batching (no prompt=[...] as in the
+    legacy completions endpoint), so batch parsing is prompt-level: one
+    request whose strict schema is an array of command objects.
+    """
+    item = copy.deepcopy(_RESPONSE_FORMAT["json_schema"]["schema"])
+    # $ref targets resolve from the schema root; hoist the enum $defs out
+    # of the item schema so they still resolve once it is nested.
+    defs = item.pop("$defs", {})
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "robot_command_batch",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "commands": {"type": "array", "items": item},
+                },
+                "required": ["commands"],
+                "additionalProperties": False,
+                "$defs": defs,
+            },
+        },
+    }
+
+
+_BATCH_RESPONSE_FORMAT = _build_batch_response_format()
+
+# One shared client per process: OpenAI() builds httpx connection pools and
+# SSL contexts, and sharing it lets HTTP keep-alive amortize the TLS
+# handshake across all parses.
+_client_lock = threading.Lock()
+_client_singleton: OpenAI | None = None
+_client_factory: type | None = None
+
+
+def _build_http_client() -> httpx.Client:
+    """Build the pooled transport shared by the singleton OpenAI client.
+
+    Long keep-alive expiry holds connections open across the gaps between
+    voice commands, so warm parses skip TCP/TLS setup entirely; timeouts
+    are kept tight because a stalled parse should fail fast into the regex
+    fallback rather than block the control loop.
+    """
+    return httpx.Client(
+        limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60.0),
+        timeout=httpx.Timeout(10.0, connect=2.0),
+    )
+
+
+def _get_client() -> OpenAI:
+    """Return the shared OpenAI client, creating it on first use.
+
+    Rebuilds the singleton if the OpenAI class has been replaced (tests
+    patch parser.llm_parser.OpenAI), so mocks never leak between runs.
+    """
+    global _client_singleton, _client_factory
+    with _client_lock:
+        if _client_singleton is None or _client_factory is not OpenAI:
+            _client_singleton = OpenAI(http_client=_build_http_client())
+            _client_factory = OpenAI
+        return _client_singleton
+
 
 class LLMCommandParser:
     """Parses spoken surgical commands into RobotCommand via OpenAI API.
 
-    Uses GPT-4o-mini with response_format=json_object to guarantee
-    valid JSON output, then validates against the RobotCommand schema.
+    Uses GPT-4o-mini with a strict json_schema response_format so the
+    output is constrained to the RobotCommand enums server-side, then
+    validates against the RobotCommand schema as a safety net.
+
+    Results are cached by (model, temperature, normalized text) so repeated
+    utterances skip the API round-trip entirely.
     """
 
+    CACHE_MAXSIZE = 128
+
+    # Don't cache results below this confidence so transient failures and
+    # garbled transcriptions aren't sticky.
+    CACHE_MIN_CONFIDENCE = 0.5
+
     def __init__(self, model: str | None = None):
         config = _load_yaml()
         llm_config = config["llm"]
         self.model = model or llm_config["model"]
         self.temperature = llm_config["temperature"]
         self.max_tokens = llm_config["max_tokens"]
-        load_dotenv(_PROJECT_ROOT / ".env")
-        self.client = OpenAI()
+        _ensure_dotenv_loaded()
+        self.client = _get_client()
+        self._async_client: AsyncOpenAI | None = None
+        self._cache: OrderedDict[tuple, RobotCommand] = OrderedDict()
+
+    def _cache_key(self, text: str) -> tuple:
+        return (self.model, round(self.temperature, 2), text.strip().lower())
 
     def parse(self, text: str) -> RobotCommand:
         """Parse a spoken command string into a validated RobotCommand.
@@ -45,32 +192,169 @@ class LLMCommandParser:
             A validated RobotCommand. On parse failure, returns a low-confidence
             STOP command as a safe fallback.
         """
+        key = self._cache_key(text)
+        hit = self._cache.get(key)
+        if hit is not None:
+            self._cache.move_to_end(key)
+            logger.info("Cache hit for '%s' -> %s", text, hit.action.value)
+            return hit.model_copy(update={"raw_text": text})
+
+        start = time.perf_counter()
+        try:
+            response = self.client.chat.completions.create(
+                **self._request_kwargs(text)
+            )
+            data = orjson.loads(response.choices[0].message.content)
+            return self._finish(key, text, data, start)
+        except (ValidationError, orjson.JSONDecodeError, Exception) as exc:
+            return self._failure(text, start, exc)
+
+    async def parse_async(self, text: str) -> RobotCommand:
+        """Async variant of parse, for batching concurrent API calls.
+
+        Used by demo/eval scripts to fan out many utterances with
+        asyncio.gather; production parsing goes through parse().
+        """
+        key = self._cache_key(text)
+        hit = self._cache.get(key)
+        if hit is not None:
+            self._cache.move_to_end(key)
+            logger.info("Cache hit for '%s' -> %s", text, hit.action.value)
+            return hit.model_copy(update={"raw_text": text})
+
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI()
+
+        start = time.perf_counter()
+        try:
+            response = await self._async_client.chat.completions.create(
+                **self._request_kwargs(text)
+            )
+            data = orjson.loads(response.choices[0].message.content)
+            return self._finish(key, text, data, start)
+        except (ValidationError, orjson.JSONDecodeError, Exception) as exc:
+            return self._failure(text, start, exc)
+
+    def parse_batch(self, texts: list[str]) -> list[RobotCommand]:
+        """Parse several utterances in one chat.completions request.
+
+        One prompt-level batch replaces N HTTP round-trips, which matters
+        for offline evaluation and queued-command replay where OpenAI's
+        per-minute request limit binds long before the token limit. Cached
+        utterances are served locally; only misses go to the API. If the
+        model returns the wrong number of results (or the request fails),
+        the misses fall back to individual parse() calls, so this degrades
+        to exactly the single-utterance behavior.
+
+        Args:
+            texts: Transcribed spoken commands, one per utterance.
+
+        Returns:
+            One RobotCommand per input text, in order.
+        """
+        results: list[RobotCommand | None] = [None] * len(texts)
+        misses: list[int] = []
+        for i, text in enumerate(texts):
+            key = self._cache_key(text)
+            hit = self._cache.get(key)
+            if hit is not None:
+                self._cache.move_to_end(key)
+                results[i] = hit.model_copy(update={"raw_text": text})
+            else:
+                misses.append(i)
+        if not misses:
+            return results
+
         start = time.perf_counter()
         try:
             response = self.client.chat.completions.create(
-                model=self.model,
-                response_format={"type": "json_object"},
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                messages=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": USER_TEMPLATE.format(text=text)},
-                ],
+                **self._batch_request_kwargs([texts[i] for i in misses])
             )
-            data = json.loads(response.choices[0].message.content)
-            data["raw_text"] = text
-            cmd = RobotCommand(**data)
-        except (ValidationError, json.JSONDecodeError, Exception) as exc:
+            parsed = orjson.loads(response.choices[0].message.content)
+            commands = parsed["commands"]
+            if len(commands) != len(misses):
+                raise ValueError(
+                    f"expected {len(misses)} results, got {len(commands)}"
+                )
+        except Exception as exc:
             elapsed_ms = (time.perf_counter() - start) * 1000
             logger.warning(
-                "Parse failed for '%s' (%.0fms): %s", text, elapsed_ms, exc
-            )
-            return RobotCommand(
-                action="STOP", magnitude=None, confidence=0.0, raw_text=text
+                "Batch parse of %d utterances failed (%.0fms): %s; "
+                "falling back to individual calls",
+                len(misses), elapsed_ms, exc,
             )
+            for i in misses:
+                results[i] = self.parse(texts[i])
+            return results
+
+        for i, data in zip(misses, commands):
+            text = texts[i]
+            try:
+                results[i] = self._finish(
+                    self._cache_key(text), text, data, start
+                )
+            except (ValidationError, TypeError, Exception) as exc:
+                results[i] = self._failure(text, start, exc)
+        return results
+
+    def _batch_request_kwargs(self, texts: list[str]) -> dict:
+        """Build the chat.completions.create kwargs for a batch."""
+        numbered = "\n".join(f"{i}. {t}" for i, t in enumerate(texts, 1))
+        return {
+            "model": self.model,
+            "response_format": _BATCH_RESPONSE_FORMAT,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens * len(texts),
+            "messages": [
+                _SYSTEM_MSG,
+                {
+                    "role": "user",
+                    "content": (
+                        f"Parse these {len(texts)} spoken commands and "
+                        f"return one result per command, in order:\n"
+                        f"{numbered}"
+                    ),
+                },
+            ],
+            "extra_body": {"prompt_cache_key": _PROMPT_CACHE_KEY},
+        }
+
+    def _request_kwargs(self, text: str) -> dict:
+        """Build the chat.completions.create kwargs for one utterance."""
+        return {
+            "model": self.model,
+            "response_format": _RESPONSE_FORMAT,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "messages": [
+                _SYSTEM_MSG,
+                {"role": "user", "content": f"Parse this spoken command: {text}"},
+            ],
+            "extra_body": {"prompt_cache_key": _PROMPT_CACHE_KEY},
+        }
+
+    def _finish(
+        self, key: tuple, text: str, data: dict, start: float
+    ) -> RobotCommand:
+        """Validate one parsed command dict and update the cache."""
+        data["raw_text"] = text
+        cmd = RobotCommand(**data)
 
         elapsed_ms = (time.perf_counter() - start) * 1000
         logger.info(
             "Parsed '%s' -> %s (%.0fms)", text, cmd.action.value, elapsed_ms
         )
+
+        if cmd.confidence >= self.CACHE_MIN_CONFIDENCE:
+            self._cache[key] = cmd.model_copy()
+            if len(self._cache) > self.CACHE_MAXSIZE:
+                self._cache.popitem(last=False)
         return cmd
+
+    def _failure(self, text: str, start: float, exc: Exception) -> RobotCommand:
+        """Log a parse failure and return the safe STOP fallback."""
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.warning(
+            "Parse failed for '%s' (%.0fms): %s", text, elapsed_ms, exc
+        )
+        return RobotCommand.create_failed_stop(text)
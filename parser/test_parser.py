@@ -65,12 +65,71 @@ class TestInvalidActionFallback:
 
 
 class TestResponseFormat:
-    """Verify response_format={"type": "json_object"} is passed."""
+    """Verify a strict json_schema response_format is passed."""
 
-    def test_json_object_format_requested(self, parser):
+    def test_strict_json_schema_requested(self, parser):
         parser.client.chat.completions.create.return_value = _mock_response(
             {"action": "MOVE_LEFT", "magnitude": "MID", "confidence": 0.9, "frame": "CAMERA"}
         )
         parser.parse("go left")
         call_kwargs = parser.client.chat.completions.create.call_args
-        assert call_kwargs.kwargs["response_format"] == {"type": "json_object"}
+        response_format = call_kwargs.kwargs["response_format"]
+        assert response_format["type"] == "json_schema"
+        assert response_format["json_schema"]["strict"] is True
+        schema = response_format["json_schema"]["schema"]
+        # raw_text/value_mm are populated client-side, not by the model
+        assert "raw_text" not in schema["properties"]
+        assert "value_mm" not in schema["properties"]
+        assert schema["additionalProperties"] is False
+        # Strict mode 400s on defaults and numeric bounds anywhere in the
+        # schema; pydantic emits both for defaulted/bounded fields.
+        assert "default" not in json.dumps(schema)
+        assert "minimum" not in json.dumps(schema)
+
+
+class TestParseBatch:
+    """Prompt-level batching of several utterances into one request."""
+
+    def test_single_request_returns_commands_in_order(self, parser):
+        parser.client.chat.completions.create.return_value = _mock_response(
+            {"commands": [
+                {"action": "MOVE_UP", "magnitude": "SMALL", "confidence": 0.95, "frame": "CAMERA"},
+                {"action": "STOP", "magnitude": None, "confidence": 0.99, "frame": "CAMERA"},
+            ]}
+        )
+        cmds = parser.parse_batch(["nudge it up", "please stop now"])
+
+        assert parser.client.chat.completions.create.call_count == 1
+        assert [c.action for c in cmds] == [Action.MOVE_UP, Action.STOP]
+        assert cmds[0].raw_text == "nudge it up"
+        assert cmds[1].raw_text == "please stop now"
+
+    def test_length_mismatch_falls_back_to_individual_calls(self, parser):
+        bad_batch = _mock_response(
+            {"commands": [
+                {"action": "MOVE_UP", "magnitude": "MID", "confidence": 0.9, "frame": "CAMERA"},
+            ]}
+        )
+        single = _mock_response(
+            {"action": "MOVE_DOWN", "magnitude": "MID", "confidence": 0.9, "frame": "CAMERA"}
+        )
+        parser.client.chat.completions.create.side_effect = [
+            bad_batch, single, single
+        ]
+        cmds = parser.parse_batch(["lower it", "go down more"])
+
+        # 1 failed batch call + 2 individual fallback calls
+        assert parser.client.chat.completions.create.call_count == 3
+        assert all(c.action == Action.MOVE_DOWN for c in cmds)
+
+    def test_cached_utterances_skip_the_api(self, parser):
+        parser.client.chat.completions.create.return_value = _mock_response(
+            {"action": "MOVE_LEFT", "magnitude": "MID", "confidence": 0.9, "frame": "CAMERA"}
+        )
+        parser.parse("slide left please")
+        parser.client.chat.completions.create.reset_mock()
+
+        cmds = parser.parse_batch(["slide left please"])
+
+        parser.client.chat.completions.create.assert_not_called()
+        assert cmds[0].action == Action.MOVE_LEFT
@@ -75,17 +75,33 @@ class TestNoMatch:
 
 
 class TestConfidence:
-    def test_all_commands_have_correct_confidence(self, parser):
+    def test_canonical_commands_use_fast_path_confidence(self, parser):
         commands = [
             "move up", "move down", "go left", "go right",
             "advance", "retract", "rotate left", "rotate right", "stop",
         ]
         for text in commands:
+            cmd = parser.parse(text)
+            assert cmd is not None, f"No match for '{text}'"
+            assert cmd.confidence == 0.9, f"Wrong confidence for '{text}'"
+
+    def test_regex_matches_keep_fallback_confidence(self, parser):
+        for text in ["go way up", "nudge the scope left"]:
             cmd = parser.parse(text)
             assert cmd is not None, f"No match for '{text}'"
             assert cmd.confidence == 0.6, f"Wrong confidence for '{text}'"
 
 
+class TestFastParse:
+    def test_canonical_hit(self, parser):
+        cmd = parser.fast_parse("Move Up ")
+        assert cmd.action == Action.MOVE_UP
+        assert cmd.confidence == 0.9
+
+    def test_non_canonical_returns_none(self, parser):
+        assert parser.fast_parse("move up a little") is None
+
+
 class TestNoisyInput:
     def test_filler_words(self, parser):
         cmd = parser.parse("uh go left I think")
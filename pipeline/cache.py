@@ -0,0 +1,72 @@
+"""Exact-match command cache for the language control pipeline.
+
+Voice commands repeat heavily ("stop", "move up a little"), and parsing is
+deterministic at temperature 0 — so repeats can skip the entire parse
+path, LLM round-trip included. Keys are aggressively normalized (case,
+whitespace, punctuation, common spoken abbreviations) so trivial
+transcription variants share an entry.
+"""
+
+import re
+from collections import OrderedDict
+
+from schema.command_schema import RobotCommand
+
+# Spoken/transcribed shorthand mapped to the canonical vocabulary.
+_ABBREVIATIONS = {
+    "lil": "little",
+    "fwd": "forward",
+    "ccw": "counterclockwise",
+    "cw": "clockwise",
+}
+
+_PUNCT_RE = re.compile(r"[^\w\s']")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Normalize an utterance into a cache key.
+
+    Lowercases, strips punctuation, collapses whitespace, and expands
+    common abbreviations.
+    """
+    lowered = _PUNCT_RE.sub(" ", text.lower())
+    tokens = [
+        _ABBREVIATIONS.get(token, token)
+        for token in _WHITESPACE_RE.split(lowered.strip())
+        if token
+    ]
+    return " ".join(tokens)
+
+
+class CommandCache:
+    """LRU cache mapping normalized utterances to validated RobotCommands.
+
+    Only commands that passed validation should be stored, so a hit can
+    always be trusted without re-parsing.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, RobotCommand] = OrderedDict()
+
+    def get(self, key: str) -> RobotCommand | None:
+        """Return the cached command for a normalized key, or None."""
+        cmd = self._entries.get(key)
+        if cmd is not None:
+            self._entries.move_to_end(key)
+        return cmd
+
+    def put(self, key: str, command: RobotCommand) -> None:
+        """Store a validated command, evicting the LRU entry if full."""
+        self._entries[key] = command
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,40 @@
+"""Shared fixtures for the pipeline tests.
+
+Building LanguageControlPipeline — even fully mocked — constructs the
+Whisper/OpenAI/recorder stack, so it happens once per session here; the
+per-test fixture just resets mock and cache state in between.
+"""
+
+import pytest
+from unittest.mock import patch
+
+
+@pytest.fixture(scope="session")
+def _session_pipeline():
+    """Build the pipeline with mocked STT and OpenAI client, once."""
+    with patch("stt.stt_whisper.whisper"), \
+         patch("stt.stt_whisper.torch") as mock_torch, \
+         patch("parser.llm_parser.OpenAI") as mock_openai_cls, \
+         patch("parser.llm_parser._ensure_dotenv_loaded"):
+
+        mock_torch.cuda.is_available.return_value = False
+
+        from pipeline.pipeline import LanguageControlPipeline
+        pipe = LanguageControlPipeline()
+
+    return pipe, mock_openai_cls
+
+
+@pytest.fixture
+def pipe_and_mocks(_session_pipeline):
+    """Session pipeline with fresh mock and cache state for each test."""
+    pipe, mock_openai_cls = _session_pipeline
+    mock_client = mock_openai_cls.return_value
+    mock_client.chat.completions.create.reset_mock(
+        return_value=True, side_effect=True
+    )
+    # Both caches persist across tests on the shared instance; clear them
+    # so one test's utterances never short-circuit another's.
+    pipe.cache.clear()
+    pipe.llm_parser._cache.clear()
+    return pipe, mock_openai_cls
@@ -60,6 +60,18 @@ class FallbackManager:
         Returns:
             (RobotCommand, source) where source is "llm", "regex", or "failed".
         """
+        # Tier-0 short-circuit: exact canonical commands ("stop",
+        # "move up", ...) are deterministic — skip the LLM round-trip.
+        try:
+            cmd = self.regex_parser.fast_parse(text)
+            if cmd is not None:
+                logger.info(
+                    "Fast path parsed '%s' -> %s", text, cmd.action.value
+                )
+                return cmd, "regex"
+        except Exception as exc:
+            logger.warning("Fast path failed for '%s': %s", text, exc)
+
         # Try LLM first
         try:
             cmd = self.llm_parser.parse(text)
@@ -85,6 +97,60 @@ class FallbackManager:
 
         # Total failure — safe STOP
         logger.error("All parsers failed for '%s', returning safe STOP", text)
-        return RobotCommand(
-            action=Action.STOP, magnitude=None, confidence=0.0, raw_text=text
-        ), "failed"
+        return RobotCommand.create_failed_stop(text), "failed"
+
+    def parse_batch_with_fallback(
+        self, texts: list[str]
+    ) -> list[tuple[RobotCommand, str]]:
+        """Parse many texts, batching the LLM tier into one request.
+
+        Fast-path hits resolve locally; only the remainder goes through
+        LLMCommandParser.parse_batch. Each low-confidence or failed batch
+        entry falls back to regex individually, so per-utterance guarantees
+        match parse_with_fallback.
+
+        Returns:
+            One (RobotCommand, source) pair per input text, in order.
+        """
+        results: list[tuple[RobotCommand, str] | None] = [None] * len(texts)
+        pending: list[int] = []
+        for i, text in enumerate(texts):
+            try:
+                cmd = self.regex_parser.fast_parse(text)
+            except Exception as exc:
+                logger.warning("Fast path failed for '%s': %s", text, exc)
+                cmd = None
+            if cmd is not None:
+                results[i] = (cmd, "regex")
+            else:
+                pending.append(i)
+        if not pending:
+            return results
+
+        try:
+            parsed = self.llm_parser.parse_batch([texts[i] for i in pending])
+        except Exception as exc:
+            logger.warning("LLM batch failed: %s, trying regex", exc)
+            parsed = [None] * len(pending)
+
+        for i, cmd in zip(pending, parsed):
+            text = texts[i]
+            if (
+                cmd is not None
+                and cmd.confidence >= self.FALLBACK_CONFIDENCE_THRESHOLD
+            ):
+                results[i] = (cmd, "llm")
+                continue
+            try:
+                fallback_cmd = self.regex_parser.parse(text)
+            except Exception as exc:
+                logger.warning("Regex failed for '%s': %s", text, exc)
+                fallback_cmd = None
+            if fallback_cmd is not None:
+                results[i] = (fallback_cmd, "regex")
+            else:
+                logger.error(
+                    "All parsers failed for '%s', returning safe STOP", text
+                )
+                results[i] = (RobotCommand.create_failed_stop(text), "failed")
+        return results
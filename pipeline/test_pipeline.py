@@ -1,9 +1,13 @@
-"""Tests for the language control pipeline."""
+"""Tests for the language control pipeline.
+
+The mocked pipeline itself is session-scoped — see conftest.py for the
+pipe_and_mocks fixture.
+"""
 
 import json
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 
 from schema.command_schema import Action, Magnitude, RobotCommand
 from pipeline.fallback import CommandValidator, FallbackManager
@@ -27,28 +31,13 @@ def _make_llm_response(action, magnitude, confidence):
     return response
 
 
-def _build_pipeline():
-    """Build a pipeline with mocked STT and OpenAI client."""
-    with patch("stt.stt_whisper.whisper"), \
-         patch("stt.stt_whisper.torch") as mock_torch, \
-         patch("parser.llm_parser.OpenAI") as mock_openai_cls, \
-         patch("parser.llm_parser.load_dotenv"):
-
-        mock_torch.cuda.is_available.return_value = False
-
-        from pipeline.pipeline import LanguageControlPipeline
-        pipe = LanguageControlPipeline()
-
-    return pipe, mock_openai_cls
-
-
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
 
 class TestProcessTextHappyPath:
-    def test_move_up_small(self):
-        pipe, mock_openai_cls = _build_pipeline()
+    def test_move_up_small(self, pipe_and_mocks):
+        pipe, mock_openai_cls = pipe_and_mocks
         mock_client = mock_openai_cls.return_value
         mock_client.chat.completions.create.return_value = _make_llm_response(
             "MOVE_UP", "SMALL", 0.95
@@ -65,8 +54,8 @@ class TestProcessTextHappyPath:
 
 
 class TestFallbackOnLLMException:
-    def test_regex_kicks_in(self):
-        pipe, mock_openai_cls = _build_pipeline()
+    def test_regex_kicks_in(self, pipe_and_mocks):
+        pipe, mock_openai_cls = pipe_and_mocks
         mock_client = mock_openai_cls.return_value
         mock_client.chat.completions.create.side_effect = RuntimeError("API down")
 
@@ -77,8 +66,8 @@ class TestFallbackOnLLMException:
 
 
 class TestTotalFailure:
-    def test_returns_safe_stop(self):
-        pipe, mock_openai_cls = _build_pipeline()
+    def test_returns_safe_stop(self, pipe_and_mocks):
+        pipe, mock_openai_cls = pipe_and_mocks
         mock_client = mock_openai_cls.return_value
         mock_client.chat.completions.create.side_effect = RuntimeError("API down")
 
@@ -101,9 +90,36 @@ class TestStopBypassesThreshold:
         assert message == "ok"
 
 
+class TestCommandCache:
+    def test_cache_hit_bypasses_llm(self, pipe_and_mocks):
+        pipe, mock_openai_cls = pipe_and_mocks
+        mock_client = mock_openai_cls.return_value
+        mock_client.chat.completions.create.return_value = _make_llm_response(
+            "MOVE_FORWARD", "SMALL", 0.92
+        )
+
+        first = pipe.process_text("advance the scope gently")
+        second = pipe.process_text("Advance the scope, gently!")
+
+        assert mock_client.chat.completions.create.call_count == 1
+        assert first["source"] == "llm"
+        assert second["source"] == "cache"
+        assert second["command"].action == Action.MOVE_FORWARD
+        assert second["command"].raw_text == "Advance the scope, gently!"
+
+    def test_invalid_results_not_cached(self, pipe_and_mocks):
+        pipe, mock_openai_cls = pipe_and_mocks
+        mock_client = mock_openai_cls.return_value
+        mock_client.chat.completions.create.side_effect = RuntimeError("API down")
+
+        pipe.process_text("gibberish that matches nothing")
+
+        assert len(pipe.cache) == 0
+
+
 class TestLatencyFields:
-    def test_latency_present_and_positive(self):
-        pipe, mock_openai_cls = _build_pipeline()
+    def test_latency_present_and_positive(self, pipe_and_mocks):
+        pipe, mock_openai_cls = pipe_and_mocks
         mock_client = mock_openai_cls.return_value
         mock_client.chat.completions.create.return_value = _make_llm_response(
             "MOVE_LEFT", "MID", 0.9
@@ -115,3 +131,32 @@ class TestLatencyFields:
         assert "latency_parse_ms" in result
         assert result["latency_stt_ms"] == 0.0  # no STT for process_text
         assert result["latency_parse_ms"] > 0
+
+
+class TestProcessBatch:
+    def test_mixes_fast_path_and_single_llm_request(self, pipe_and_mocks):
+        pipe, mock_openai_cls = pipe_and_mocks
+        mock_client = mock_openai_cls.return_value
+        choice = MagicMock()
+        choice.message.content = json.dumps(
+            {"commands": [
+                {"action": "MOVE_UP", "magnitude": "SMALL", "confidence": 0.95},
+                {"action": "RETRACT", "magnitude": "BIG", "confidence": 0.9},
+            ]}
+        )
+        batch_response = MagicMock()
+        batch_response.choices = [choice]
+        mock_client.chat.completions.create.return_value = batch_response
+
+        results = pipe.process_batch(
+            ["stop", "nudge it up slightly", "pull way back please"]
+        )
+
+        # "stop" is canonical and never reaches the API; the two fuzzy
+        # utterances share one batched request.
+        assert mock_client.chat.completions.create.call_count == 1
+        assert results[0]["source"] == "regex"
+        assert results[0]["command"].action == Action.STOP
+        assert results[1]["command"].action == Action.MOVE_UP
+        assert results[2]["command"].action == Action.RETRACT
+        assert all(r["valid"] for r in results)
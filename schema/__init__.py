@@ -1,5 +1,19 @@
 """Command schema package — public API."""
 
-from schema.command_schema import Action, Magnitude, MAGNITUDE_MM, RobotCommand
+from schema.command_schema import (
+    Action,
+    Magnitude,
+    MAGNITUDE_MM,
+    MAGNITUDE_MM_ARR,
+    RobotCommand,
+    RobotCommandBatch,
+)
 
-__all__ = ["Action", "Magnitude", "MAGNITUDE_MM", "RobotCommand"]
+__all__ = [
+    "Action",
+    "Magnitude",
+    "MAGNITUDE_MM",
+    "MAGNITUDE_MM_ARR",
+    "RobotCommand",
+    "RobotCommandBatch",
+]
@@ -8,6 +8,7 @@ consume.
 from enum import Enum
 from typing import Optional
 
+import numpy as np
 from pydantic import BaseModel, Field, model_validator
 
 
@@ -33,10 +34,14 @@ class Magnitude(str, Enum):
     BIG = "BIG"
 
 
+# Magnitude -> millimeters, indexed by enum declaration order. The array
+# is the single source of truth (shared with RobotCommandBatch); the dict
+# view serves scalar call sites, where one enum-keyed lookup measures
+# faster than ordinal indirection into the array.
+_MAG_INT: dict[Magnitude, int] = {m: i for i, m in enumerate(Magnitude)}
+MAGNITUDE_MM_ARR = np.array([2.0, 4.0, 6.0], dtype=np.float32)
 MAGNITUDE_MM: dict[Magnitude, float] = {
-    Magnitude.SMALL: 2.0,
-    Magnitude.MID: 4.0,
-    Magnitude.BIG: 6.0,
+    m: float(MAGNITUDE_MM_ARR[i]) for m, i in _MAG_INT.items()
 }
 
 
@@ -97,3 +102,133 @@ class RobotCommand(BaseModel):
             confidence=1.0,
             raw_text=raw_text,
         )
+
+    @classmethod
+    def construct_trusted(
+        cls,
+        action: Action,
+        magnitude: Optional[Magnitude],
+        confidence: float,
+        raw_text: str,
+        frame: str = "CAMERA",
+    ) -> "RobotCommand":
+        """Build a RobotCommand without running the validator chain.
+
+        For values produced by code we control (the regex fallback tiers)
+        this replays the STOP/value_mm invariants inline and calls
+        model_construct, which cannot raise — the fallback path must
+        always yield a command. It is a semantics bypass, not a speed
+        win: benchmark/bench_schema.py measures it slower than validated
+        construction, which is why the LLM path sticks with
+        RobotCommand(**data). Never use it on untrusted external JSON.
+        """
+        if action is Action.STOP:
+            magnitude = None
+            value_mm = None
+        else:
+            if magnitude is None:
+                magnitude = Magnitude.MID
+            value_mm = MAGNITUDE_MM[magnitude]
+        return cls.model_construct(
+            action=action,
+            magnitude=magnitude,
+            frame=frame,
+            confidence=confidence,
+            value_mm=value_mm,
+            raw_text=raw_text,
+        )
+
+    @classmethod
+    def create_failed_stop(cls, raw_text: str) -> "RobotCommand":
+        """Create the zero-confidence STOP returned on parse failure.
+
+        Copies a pre-validated template instead of re-running the full
+        validator chain — parse failures sit on the hot fallback path.
+
+        Args:
+            raw_text: The original spoken text that failed to parse.
+        """
+        return _FAILED_STOP_TEMPLATE.model_copy(update={"raw_text": raw_text})
+
+
+# Validated once at import; create_failed_stop hands out cheap copies.
+_FAILED_STOP_TEMPLATE = RobotCommand(
+    action=Action.STOP, magnitude=None, confidence=0.0, raw_text=""
+)
+
+
+# Integer codes for the batch container below.
+_ACTION_INT: dict[Action, int] = {a: i for i, a in enumerate(Action)}
+_STOP_CODE = _ACTION_INT[Action.STOP]
+
+
+class RobotCommandBatch:
+    """Structure-of-arrays container for a batch of robot commands.
+
+    Where RobotCommand is one Pydantic object per command, this packs N
+    commands into parallel numpy arrays so batch operations (reranking
+    LLM samples, replaying test corpora) are vectorized instead of a
+    Python loop over attribute accesses.
+
+    Attributes:
+        action: int8 array of Action enum codes (declaration order).
+        magnitude: int8 array of Magnitude codes; -1 means no magnitude.
+        confidence: float32 array of confidence scores.
+        raw_text: list of the original utterances.
+    """
+
+    def __init__(
+        self,
+        action: np.ndarray,
+        magnitude: np.ndarray,
+        confidence: np.ndarray,
+        raw_text: list[str],
+    ):
+        self.action = action
+        self.magnitude = magnitude
+        self.confidence = confidence
+        self.raw_text = raw_text
+
+    @classmethod
+    def from_dicts(cls, dicts: list[dict]) -> "RobotCommandBatch":
+        """Build a batch from parsed command dicts in one pass.
+
+        Each dict uses the RobotCommand field names; "magnitude" may be
+        None or absent (treated as no magnitude, as for STOP).
+        """
+        n = len(dicts)
+        action = np.empty(n, dtype=np.int8)
+        magnitude = np.full(n, -1, dtype=np.int8)
+        confidence = np.empty(n, dtype=np.float32)
+        raw_text = []
+        for i, d in enumerate(dicts):
+            code = _ACTION_INT[Action(d["action"])]
+            action[i] = code
+            # Absent magnitude defaults to MID, as on the scalar model;
+            # an explicit None (and STOP) means no magnitude.
+            mag = d.get("magnitude", Magnitude.MID)
+            if mag is not None and code != _STOP_CODE:
+                magnitude[i] = _MAG_INT[Magnitude(mag)]
+            confidence[i] = d["confidence"]
+            raw_text.append(d.get("raw_text", ""))
+        return cls(action, magnitude, confidence, raw_text)
+
+    def __len__(self) -> int:
+        return self.action.shape[0]
+
+    def valid_mask(self) -> np.ndarray:
+        """Vectorized RobotCommand.is_valid: confidence >= 0.7."""
+        return self.confidence >= 0.7
+
+    def value_mm(self) -> np.ndarray:
+        """Millimeter values for the batch; 0.0 where no magnitude applies."""
+        mm = MAGNITUDE_MM_ARR[np.clip(self.magnitude, 0, None)]
+        mm[self.magnitude < 0] = 0.0
+        return mm
+
+    def best_index(self) -> int:
+        """Index of the highest-confidence valid command (-1 if none)."""
+        scores = self.confidence * self.valid_mask()
+        if not scores.any():
+            return -1
+        return int(np.argmax(scores))
@@ -3,7 +3,13 @@
 import pytest
 from pydantic import ValidationError
 
-from schema.command_schema import Action, Magnitude, MAGNITUDE_MM, RobotCommand
+from schema.command_schema import (
+    Action,
+    Magnitude,
+    MAGNITUDE_MM,
+    RobotCommand,
+    RobotCommandBatch,
+)
 
 
 class TestValidCommandCreation:
@@ -159,6 +165,42 @@ class TestCreateStop:
         assert cmd.frame == "CAMERA"
 
 
+class TestConstructTrusted:
+    """The validator-bypassing trusted construction path."""
+
+    def test_matches_validated_construction(self):
+        trusted = RobotCommand.construct_trusted(
+            action=Action.MOVE_UP,
+            magnitude=Magnitude.SMALL,
+            confidence=0.9,
+            raw_text="up a bit",
+        )
+        validated = RobotCommand(
+            action="MOVE_UP", magnitude="SMALL", confidence=0.9, raw_text="up a bit"
+        )
+        assert trusted == validated
+
+    def test_stop_clears_magnitude_and_value(self):
+        cmd = RobotCommand.construct_trusted(
+            action=Action.STOP,
+            magnitude=Magnitude.BIG,
+            confidence=1.0,
+            raw_text="stop",
+        )
+        assert cmd.magnitude is None
+        assert cmd.value_mm is None
+
+    def test_none_magnitude_defaults_to_mid(self):
+        cmd = RobotCommand.construct_trusted(
+            action=Action.MOVE_LEFT,
+            magnitude=None,
+            confidence=0.8,
+            raw_text="left",
+        )
+        assert cmd.magnitude == Magnitude.MID
+        assert cmd.value_mm == 4.0
+
+
 class TestIsValid:
     """The is_valid helper at boundary."""
 
@@ -173,3 +215,48 @@ class TestIsValid:
     def test_above_threshold_returns_true(self):
         cmd = RobotCommand(action="MOVE_UP", confidence=0.95, raw_text="test")
         assert cmd.is_valid() is True
+
+
+class TestRobotCommandBatch:
+    """SoA batch container and vectorized validation."""
+
+    DICTS = [
+        {"action": "MOVE_UP", "magnitude": "SMALL", "confidence": 0.9,
+         "raw_text": "go up a little"},
+        {"action": "STOP", "magnitude": None, "confidence": 1.0,
+         "raw_text": "stop"},
+        {"action": "MOVE_LEFT", "magnitude": "BIG", "confidence": 0.5,
+         "raw_text": "way left"},
+        {"action": "RETRACT", "confidence": 0.8, "raw_text": "pull back"},
+    ]
+
+    def test_from_dicts_length(self):
+        batch = RobotCommandBatch.from_dicts(self.DICTS)
+        assert len(batch) == 4
+
+    def test_valid_mask(self):
+        batch = RobotCommandBatch.from_dicts(self.DICTS)
+        assert batch.valid_mask().tolist() == [True, True, False, True]
+
+    def test_value_mm(self):
+        batch = RobotCommandBatch.from_dicts(self.DICTS)
+        # STOP gets 0.0; absent magnitude defaults to MID.
+        assert batch.value_mm().tolist() == [2.0, 0.0, 6.0, 4.0]
+
+    def test_best_index_prefers_valid_top_confidence(self):
+        batch = RobotCommandBatch.from_dicts(self.DICTS)
+        assert batch.best_index() == 1
+
+    def test_best_index_all_invalid(self):
+        batch = RobotCommandBatch.from_dicts(
+            [{"action": "MOVE_UP", "confidence": 0.1, "raw_text": "up"}]
+        )
+        assert batch.best_index() == -1
+
+    def test_matches_scalar_model(self):
+        batch = RobotCommandBatch.from_dicts(self.DICTS)
+        for i, d in enumerate(self.DICTS):
+            cmd = RobotCommand(**d)
+            assert bool(batch.valid_mask()[i]) == cmd.is_valid()
+            expected = cmd.value_mm if cmd.value_mm is not None else 0.0
+            assert batch.value_mm()[i] == pytest.approx(expected)
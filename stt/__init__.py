@@ -1,13 +1,22 @@
 """Speech-to-text module using OpenAI Whisper."""
 
-__all__ = ["WhisperSTT", "AudioRecorder"]
+import os
 
+__all__ = ["WhisperSTT", "AudioRecorder"]
 
-def __getattr__(name):
-    if name == "WhisperSTT":
-        from stt.stt_whisper import WhisperSTT
-        return WhisperSTT
-    if name == "AudioRecorder":
-        from stt.audio_recorder import AudioRecorder
-        return AudioRecorder
-    raise AttributeError(f"module 'stt' has no attribute {name!r}")
+if not os.environ.get("G1_STT_LAZY"):
+    # Production always needs both classes, so eager imports avoid the
+    # module-__getattr__ dispatch on every attribute access.
+    from stt.audio_recorder import AudioRecorder
+    from stt.stt_whisper import WhisperSTT
+else:
+    # Lazy mode for CLI tools (e.g. g1-voice-warmup) that only touch one
+    # submodule and shouldn't pay for torch/whisper or soundfile loading.
+    def __getattr__(name):
+        if name == "WhisperSTT":
+            from stt.stt_whisper import WhisperSTT
+            return WhisperSTT
+        if name == "AudioRecorder":
+            from stt.audio_recorder import AudioRecorder
+            return AudioRecorder
+        raise AttributeError(f"module 'stt' has no attribute {name!r}")
@@ -0,0 +1,47 @@
+"""JIT-compiled audio preprocessing helpers.
+
+Provides a fused dtype-cast + pad/trim for the pre-Whisper conditioning
+step, compiled with Numba when available. Numba is optional: without it a
+vectorized NumPy fallback keeps behavior identical.
+"""
+
+import os
+from pathlib import Path
+
+import numpy as np
+
+# Persist compiled kernels across process restarts in a repo-local cache;
+# must be set before Numba compiles anything.
+os.environ.setdefault(
+    "NUMBA_CACHE_DIR",
+    str(Path(__file__).resolve().parent.parent / ".numba_cache"),
+)
+
+try:
+    from numba import njit
+except ImportError:  # optional accelerator; NumPy fallback below
+    njit = None
+
+# Whisper's fixed context: 30 s at 16 kHz.
+N_SAMPLES = 480_000
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def pad_or_trim_f32(x, n=N_SAMPLES):
+        """Cast to float32 and zero-pad/trim to n samples in one pass."""
+        out = np.zeros(n, dtype=np.float32)
+        m = min(x.shape[0], n)
+        for i in range(m):
+            out[i] = np.float32(x[i])
+        return out
+
+else:
+
+    def pad_or_trim_f32(x, n=N_SAMPLES):
+        """Cast to float32 and zero-pad/trim to n samples in one pass."""
+        out = np.zeros(n, dtype=np.float32)
+        m = min(x.shape[0], n)
+        out[:m] = x[:m]
+        return out
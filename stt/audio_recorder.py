@@ -4,8 +4,10 @@ Records via PulseAudio (parec) so it works through PipeWire and can
 access USB microphones. Saves WAV files via soundfile.
 """
 
+import functools
 import logging
 import subprocess
+import threading
 import time
 
 import numpy as np
@@ -14,8 +16,51 @@ import soundfile as sf
 logger = logging.getLogger(__name__)
 
 
+class _PipeReader(threading.Thread):
+    """Drains float32 PCM from a pipe into a preallocated buffer.
+
+    Converting chunks while recording (instead of one giant read at stop)
+    keeps peak memory at 1x the audio length and means the buffer is ready
+    for transcription the moment recording ends. Samples past the buffer
+    capacity are dropped.
+    """
+
+    CHUNK_BYTES = 65536
+
+    def __init__(self, stream, buf: np.ndarray):
+        super().__init__(name="parec-reader", daemon=True)
+        self._stream = stream
+        self._buf = buf
+        self.samples_written = 0
+
+    def run(self):
+        capacity = self._buf.shape[0]
+        remainder = b""
+        while True:
+            chunk = self._stream.read(self.CHUNK_BYTES)
+            if not chunk:
+                break
+            # Reads can split a float32 across chunks; carry the tail.
+            data = remainder + chunk
+            usable = len(data) - (len(data) % 4)
+            remainder = data[usable:]
+            samples = np.frombuffer(data[:usable], dtype=np.float32)
+            n = min(samples.shape[0], capacity - self.samples_written)
+            if n:
+                self._buf[self.samples_written:self.samples_written + n] = (
+                    samples[:n]
+                )
+                self.samples_written += n
+
+
+@functools.lru_cache(maxsize=1)
 def _find_source() -> str | None:
-    """Auto-detect a PulseAudio input source, preferring USB mics."""
+    """Auto-detect a PulseAudio input source, preferring USB mics.
+
+    Cached for the process lifetime: the probe forks pactl and parses its
+    output, and the source list only changes when audio hardware does —
+    call invalidate_source_cache() after plugging/unplugging a mic.
+    """
     try:
         out = subprocess.check_output(
             ["pactl", "list", "sources", "short"], text=True
@@ -37,6 +82,11 @@ def _find_source() -> str | None:
     return sources[0] if sources else None
 
 
+def invalidate_source_cache() -> None:
+    """Force the next AudioRecorder to re-probe PulseAudio sources."""
+    _find_source.cache_clear()
+
+
 class AudioRecorder:
     """Records audio from the microphone via PulseAudio.
 
@@ -44,6 +94,10 @@ class AudioRecorder:
     which has access to all audio devices including USB mics.
     """
 
+    # Capacity of the preallocated recording buffer; matches Whisper's
+    # 30 s context window.
+    MAX_SECONDS = 30
+
     def __init__(self, sample_rate: int = 16000, channels: int = 1):
         self.sample_rate = sample_rate
         self.channels = channels
@@ -68,21 +122,33 @@ class AudioRecorder:
     def record_push_to_talk(self) -> np.ndarray:
         """Record audio with push-to-talk: ENTER to start, ENTER to stop.
 
+        Bytes are streamed into a preallocated buffer while recording, so
+        stopping returns a ready view with no trailing drain or copy.
+
         Returns:
             Float32 numpy array of audio samples in [-1, 1].
         """
         input("Press ENTER to start recording...")
 
         proc = subprocess.Popen(
-            self._parec_cmd(), stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            self._parec_cmd(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0,
         )
+        buf = np.empty(
+            self.sample_rate * self.channels * self.MAX_SECONDS,
+            dtype=np.float32,
+        )
+        reader = _PipeReader(proc.stdout, buf)
+        reader.start()
 
         input("Recording... Press ENTER to stop.")
         proc.terminate()
-        raw = proc.stdout.read()
+        reader.join()
         proc.wait()
 
-        audio = np.frombuffer(raw, dtype=np.float32)
+        audio = buf[: reader.samples_written]
         logger.info(
             "Recorded %.2fs of audio (%d samples at %dHz)",
             len(audio) / self.sample_rate,
@@ -91,6 +157,78 @@ class AudioRecorder:
         )
         return audio
 
+    def stream_chunks(
+        self,
+        chunk_seconds: float = 0.5,
+        silence_seconds: float = 0.8,
+        silence_threshold: float = 0.01,
+    ):
+        """Yield float32 audio chunks, ending on trailing silence.
+
+        Starts capturing immediately and stops once speech has been heard
+        and is followed by silence_seconds of quiet (energy-based
+        endpointing on each chunk's RMS), or at MAX_SECONDS. Feeding the
+        chunks to WhisperSTT.transcribe_stream overlaps transcription prep
+        with recording instead of running them back to back.
+
+        Args:
+            chunk_seconds: Duration of each yielded chunk.
+            silence_seconds: Trailing quiet needed to end the stream once
+                speech has been detected.
+            silence_threshold: RMS level below which a chunk counts as
+                silence.
+
+        Yields:
+            Float32 numpy arrays of audio samples in [-1, 1].
+        """
+        chunk_bytes = int(self.sample_rate * self.channels * 4 * chunk_seconds)
+        max_chunks = int(self.MAX_SECONDS / chunk_seconds)
+        silence_chunks = max(1, round(silence_seconds / chunk_seconds))
+
+        proc = subprocess.Popen(
+            self._parec_cmd(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0,
+        )
+        try:
+            speech_seen = False
+            quiet_chunks = 0
+            pending = b""
+            eof = False
+            for _ in range(max_chunks):
+                # With bufsize=0 each read returns whatever is in the pipe
+                # (often far less than requested), so accumulate until a
+                # full chunk is buffered — the chunk count must track wall
+                # time or the endpoint window and the 30 s cap collapse.
+                while len(pending) < chunk_bytes:
+                    data = proc.stdout.read(chunk_bytes - len(pending))
+                    if not data:
+                        eof = True
+                        break
+                    pending += data
+                usable = len(pending) - (len(pending) % 4)
+                chunk = np.frombuffer(pending[:usable], dtype=np.float32)
+                pending = pending[usable:] if not eof else b""
+                if not chunk.size:
+                    break
+                yield chunk
+                if eof:
+                    break
+
+                rms = float(np.sqrt(np.mean(chunk * chunk)))
+                if rms >= silence_threshold:
+                    speech_seen = True
+                    quiet_chunks = 0
+                elif speech_seen:
+                    quiet_chunks += 1
+                    if quiet_chunks >= silence_chunks:
+                        logger.info("Endpoint detected, stopping stream.")
+                        break
+        finally:
+            proc.terminate()
+            proc.wait()
+
     def record_fixed_duration(self, duration_seconds: float = 5.0) -> np.ndarray:
         """Record audio for a fixed duration.
 
@@ -103,14 +241,26 @@ class AudioRecorder:
         logger.info("Recording %.1fs of audio...", duration_seconds)
 
         proc = subprocess.Popen(
-            self._parec_cmd(), stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            self._parec_cmd(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0,
+        )
+        # Size the buffer for the requested duration (plus slack for the
+        # stop latency) instead of the push-to-talk maximum.
+        capacity = int(
+            self.sample_rate * self.channels * (duration_seconds + 1.0)
         )
+        buf = np.empty(capacity, dtype=np.float32)
+        reader = _PipeReader(proc.stdout, buf)
+        reader.start()
+
         time.sleep(duration_seconds)
         proc.terminate()
-        raw = proc.stdout.read()
+        reader.join()
         proc.wait()
 
-        audio = np.frombuffer(raw, dtype=np.float32)
+        audio = buf[: reader.samples_written]
         logger.info("Recorded %d samples at %dHz.", len(audio), self.sample_rate)
         return audio
 
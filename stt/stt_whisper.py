@@ -5,12 +5,16 @@ of spoken surgical commands.
 """
 
 import logging
+import threading
 import time
 
 import numpy as np
 import torch
 import whisper
 
+from stt._fast import N_SAMPLES, pad_or_trim_f32
+from stt.warmup import warmup
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,25 +23,81 @@ class WhisperSTT:
 
     Loads a Whisper model on init and provides methods to transcribe
     audio from files or numpy arrays.
+
+    Two backends are supported via the ``whisper.backend`` config key:
+    "openai" (the reference PyTorch implementation, default) and "faster"
+    (faster-whisper/CTranslate2 with int8 quantization on CPU — roughly
+    4x faster there, but an optional extra dependency).
     """
 
-    def __init__(self, model_size: str = "base.en", device: str | None = None):
+    def __init__(
+        self,
+        model_size: str = "base.en",
+        device: str | None = None,
+        backend: str = "openai",
+    ):
         """Load a Whisper model.
 
         Args:
             model_size: Whisper model variant (e.g. "tiny.en", "base.en").
             device: "cuda" or "cpu". Auto-detects if None.
+            backend: "openai" or "faster" (requires faster-whisper).
         """
+        if backend not in ("openai", "faster"):
+            raise ValueError(f"Unknown Whisper backend: {backend!r}")
         if device is None:
             device = "cuda" if torch.cuda.is_available() else "cpu"
         self.device = device
         self.model_size = model_size
+        self.backend = backend
         self.fp16 = device == "cuda"
 
+        if backend == "faster":
+            # Optional dependency: not in requirements.txt, installed
+            # explicitly on deployments that want the CTranslate2 path.
+            from faster_whisper import WhisperModel
+
+            compute_type = "int8" if device == "cpu" else "float16"
+            logger.info(
+                "Loading faster-whisper model '%s' on %s (%s)...",
+                model_size, device, compute_type,
+            )
+            self.model = WhisperModel(
+                model_size, device=device, compute_type=compute_type
+            )
+            logger.info("faster-whisper model loaded.")
+            return
+
+        # Decoding options and the device handle never change per call;
+        # building them here keeps transcribe_array allocation-free.
+        self._decode_opts = whisper.DecodingOptions(
+            language="en", fp16=self.fp16
+        )
+        self._torch_device = torch.device(device)
+
+        # Compile the JIT preprocessing helpers while the (much slower)
+        # model load runs, so neither cost lands on the first command.
+        warmup_thread = threading.Thread(target=warmup, daemon=True)
+        warmup_thread.start()
+
         logger.info("Loading Whisper model '%s' on %s...", model_size, device)
         self.model = whisper.load_model(model_size, device=device)
         logger.info("Whisper model loaded.")
 
+        # Build the mel filterbank now (whisper caches it per device) so
+        # the first transcription doesn't pay for it, and keep a pinned
+        # staging tensor on CUDA so the per-call host->device copy of the
+        # padded audio can run asynchronously.
+        self._n_mels = self.model.dims.n_mels
+        whisper.audio.mel_filters(self._torch_device, self._n_mels)
+        self._audio_pinned = (
+            torch.empty(N_SAMPLES, dtype=torch.float32, pin_memory=True)
+            if device == "cuda"
+            else None
+        )
+
+        warmup_thread.join()
+
     def transcribe_file(self, audio_path: str) -> dict:
         """Transcribe an audio file.
 
@@ -48,6 +108,9 @@ class WhisperSTT:
             {"text": str, "language": str, "duration": float}
             where duration is the Whisper processing time in seconds.
         """
+        if self.backend == "faster":
+            return self._transcribe_faster(audio_path)
+
         start = time.perf_counter()
         result = self.model.transcribe(
             audio_path, language="en", fp16=self.fp16
@@ -71,14 +134,66 @@ class WhisperSTT:
             {"text": str, "language": str, "duration": float}
             where duration is the Whisper processing time in seconds.
         """
-        audio = whisper.pad_or_trim(audio_array.astype(np.float32))
+        if self.backend == "faster":
+            return self._transcribe_faster(audio_array)
+
+        return self._decode_padded(pad_or_trim_f32(audio_array))
 
+    def transcribe_stream(self, chunks) -> dict:
+        """Transcribe audio from an iterator of float32 chunks.
+
+        Chunks (e.g. from AudioRecorder.stream_chunks) are copied into the
+        padded decode buffer as they arrive, so preparation overlaps
+        recording and decoding starts the moment the stream ends —
+        total latency is recording + decode with no concatenate/pad step
+        in between.
+
+        Returns:
+            {"text": str, "language": str, "duration": float}
+            where duration is the Whisper processing time in seconds.
+        """
+        buf = np.zeros(N_SAMPLES, dtype=np.float32)
+        cursor = 0
+        for chunk in chunks:
+            n = min(chunk.shape[0], N_SAMPLES - cursor)
+            if n:
+                buf[cursor:cursor + n] = chunk[:n]
+                cursor += n
+
+        if self.backend == "faster":
+            return self._transcribe_faster(buf[:cursor])
+        return self._decode_padded(buf)
+
+    def _decode_padded(self, audio: np.ndarray) -> dict:
+        """Decode audio already padded/trimmed to Whisper's window."""
         start = time.perf_counter()
-        mel = whisper.log_mel_spectrogram(audio).to(self.device)
-        options = whisper.DecodingOptions(language="en", fp16=self.fp16)
-        result = whisper.decode(self.model, mel, options)
+        if self._audio_pinned is not None:
+            # Stage through pinned memory so the device transfer inside
+            # log_mel_spectrogram doesn't block on a pageable copy.
+            self._audio_pinned.copy_(torch.from_numpy(audio))
+            audio = self._audio_pinned
+        mel = whisper.log_mel_spectrogram(
+            audio, n_mels=self._n_mels, device=self._torch_device
+        )
+        result = whisper.decode(self.model, mel, self._decode_opts)
         duration = time.perf_counter() - start
 
         text = result.text.strip()
         logger.info("Transcribed array in %.2fs: '%s'", duration, text)
         return {"text": text, "language": "en", "duration": duration}
+
+    def _transcribe_faster(self, audio: "np.ndarray | str") -> dict:
+        """Transcribe via the faster-whisper backend.
+
+        CTranslate2 does its own padding and mel extraction, so arrays
+        and file paths take the same call.
+        """
+        start = time.perf_counter()
+        segments, _info = self.model.transcribe(
+            audio, language="en", beam_size=1, vad_filter=False
+        )
+        text = "".join(segment.text for segment in segments).strip()
+        duration = time.perf_counter() - start
+
+        logger.info("Transcribed (faster) in %.2fs: '%s'", duration, text)
+        return {"text": text, "language": "en", "duration": duration}
@@ -47,6 +47,10 @@ class TestWhisperSTTInit:
         # torch.cuda.is_available should not be called when device is explicit
         assert stt.device == "cpu"
 
+    def test_unknown_backend_rejected(self):
+        with pytest.raises(ValueError, match="backend"):
+            WhisperSTT(model_size="tiny.en", backend="whisper.cpp")
+
 
 class TestTranscribeArray:
     @patch("stt.stt_whisper.whisper")
@@ -104,3 +108,127 @@ class TestSaveWav:
             assert len(data) == 16000
         finally:
             os.unlink(path)
+
+
+class TestSourceProbeCache:
+    def test_probe_runs_once_per_process(self):
+        from stt import audio_recorder
+
+        audio_recorder.invalidate_source_cache()
+        with patch.object(
+            audio_recorder.subprocess, "check_output",
+            return_value="0\talsa_input.usb-mic\tmodule\tfloat32le\n",
+        ) as mock_probe:
+            AudioRecorder()
+            AudioRecorder()
+            assert mock_probe.call_count == 1
+
+            audio_recorder.invalidate_source_cache()
+            AudioRecorder()
+            assert mock_probe.call_count == 2
+        audio_recorder.invalidate_source_cache()
+
+
+class _TricklingPipe:
+    """Pipe whose reads return short bursts, like a raw unbuffered fd.
+
+    With bufsize=0 a real pipe hands back whatever parec has produced so
+    far — far less than the requested chunk — so the fakes must not
+    always return full-size reads.
+    """
+
+    def __init__(self, data: bytes, burst: int = 1024):
+        self._data = data
+        self._pos = 0
+        self._burst = burst
+
+    def read(self, n: int) -> bytes:
+        out = self._data[self._pos:self._pos + min(n, self._burst)]
+        self._pos += len(out)
+        return out
+
+
+class TestStreamChunks:
+    def _fake_proc(self, chunks, burst: int = 1024):
+        proc = MagicMock()
+        proc.stdout = _TricklingPipe(
+            b"".join(c.tobytes() for c in chunks), burst=burst
+        )
+        return proc
+
+    def test_stops_after_trailing_silence(self):
+        from stt import audio_recorder
+
+        loud = np.full(8000, 0.5, dtype=np.float32)
+        silence = np.zeros(8000, dtype=np.float32)
+        # Speech, then enough quiet to endpoint; the trailing loud chunk
+        # must never be read.
+        fake = self._fake_proc([loud, silence, silence, loud])
+
+        recorder = AudioRecorder()
+        with patch.object(
+            audio_recorder.subprocess, "Popen", return_value=fake
+        ):
+            chunks = list(
+                recorder.stream_chunks(chunk_seconds=0.5, silence_seconds=0.8)
+            )
+
+        assert len(chunks) == 3
+        # Short pipe reads must be accumulated into full-duration chunks,
+        # or the endpoint window and MAX_SECONDS cap shrink drastically.
+        assert all(c.shape[0] == 8000 for c in chunks)
+        assert chunks[0][0] == pytest.approx(0.5)
+        fake.terminate.assert_called_once()
+
+    def test_leading_silence_does_not_endpoint(self):
+        from stt import audio_recorder
+
+        loud = np.full(8000, 0.5, dtype=np.float32)
+        silence = np.zeros(8000, dtype=np.float32)
+        fake = self._fake_proc([silence, silence, silence, loud])
+
+        recorder = AudioRecorder()
+        with patch.object(
+            audio_recorder.subprocess, "Popen", return_value=fake
+        ):
+            chunks = list(
+                recorder.stream_chunks(chunk_seconds=0.5, silence_seconds=0.8)
+            )
+
+        # Quiet before any speech never triggers the endpoint; the stream
+        # runs until the pipe is exhausted (the last, partial read is
+        # still yielded).
+        assert len(chunks) == 4
+        assert sum(c.shape[0] for c in chunks) == 4 * 8000
+
+
+class TestTranscribeStream:
+    @patch("stt.stt_whisper.whisper")
+    @patch("stt.stt_whisper.torch")
+    def test_accumulates_chunks_and_decodes_once(self, mock_torch, mock_whisper):
+        mock_torch.cuda.is_available.return_value = False
+        mock_whisper.load_model.return_value = MagicMock()
+
+        mock_result = MagicMock()
+        mock_result.text = " retract slowly "
+        mock_whisper.decode.return_value = mock_result
+        mock_mel = MagicMock()
+        mock_whisper.log_mel_spectrogram.return_value = mock_mel
+
+        stt = WhisperSTT(model_size="tiny.en")
+        chunks = [
+            np.full(8000, 0.1, dtype=np.float32),
+            np.full(8000, 0.2, dtype=np.float32),
+        ]
+
+        result = stt.transcribe_stream(iter(chunks))
+
+        assert result["text"] == "retract slowly"
+        assert result["language"] == "en"
+        mock_whisper.decode.assert_called_once()
+        # The accumulated buffer is already padded to the decode window.
+        audio_arg = mock_whisper.log_mel_spectrogram.call_args.args[0]
+        assert audio_arg.shape[0] == 480_000
+        assert audio_arg[0] == pytest.approx(0.1)
+        assert audio_arg[8000] == pytest.approx(0.2)
+        assert audio_arg[16000] == 0.0
@@ -0,0 +1,54 @@
+"""Numba JIT cache warmup for the STT pipeline.
+
+The first call into a fresh @njit function pays compile latency that a
+voice control loop can't afford. warmup() pre-triggers compilation of all
+jitted helpers so their machine code is ready (and cached on disk under
+NUMBA_CACHE_DIR) before the first real command.
+
+Also exposed as a console script for provisioning. Set G1_STT_LAZY so the
+stt package skips its eager torch/whisper/soundfile imports (the variable
+must come from the environment — the package is already imported by the
+time main() runs):
+
+    G1_STT_LAZY=1 g1-voice-warmup
+"""
+
+import logging
+import threading
+import time
+
+import numpy as np
+
+from stt._fast import pad_or_trim_f32
+
+logger = logging.getLogger(__name__)
+
+_warmup_lock = threading.Lock()
+_warmed = False
+
+
+def warmup() -> None:
+    """Compile all jitted STT helpers, once per process.
+
+    Safe to call from a background thread; concurrent callers block until
+    the first compile finishes.
+    """
+    global _warmed
+    with _warmup_lock:
+        if _warmed:
+            return
+        start = time.perf_counter()
+        pad_or_trim_f32(np.zeros(1, dtype=np.float32))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.info("STT JIT warmup done in %.0fms", elapsed_ms)
+        _warmed = True
+
+
+def main() -> None:
+    """Console entry point: populate the on-disk JIT cache."""
+    logging.basicConfig(level=logging.INFO)
+    warmup()
+
+
+if __name__ == "__main__":
+    main()